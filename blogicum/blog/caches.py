@@ -0,0 +1,19 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+
+PUBLISHED_POSTS_COUNT_KEY = 'published_posts_count'
+CONTENT_VERSION_KEY = 'blog_content_version'
+
+
+def get_content_version():
+    """Версия содержимого блога: меняется при любой правке данных.
+
+    Хранится без срока годности, поэтому кэш должен быть общим
+    для всех процессов (см. CACHES в настройках).
+    """
+    return cache.get_or_set(CONTENT_VERSION_KEY, lambda: uuid4().hex, None)
+
+
+def reset_content_caches():
+    cache.delete_many((PUBLISHED_POSTS_COUNT_KEY, CONTENT_VERSION_KEY))
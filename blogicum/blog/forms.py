@@ -1,17 +1,45 @@
+import re
+from datetime import datetime
+
 from django import forms
+from django.forms.utils import from_current_timezone
 
 from .models import Post, Comment
 
+DATETIME_LOCAL_FORMAT = '%Y-%m-%dT%H:%M'
+DATETIME_LOCAL_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}', re.ASCII)
+
+
+class DateTimeLocalField(forms.DateTimeField):
+    """Поле даты для виджета datetime-local.
+
+    Строку вида YYYY-MM-DDTHH:MM разбирает datetime.fromisoformat,
+    остальные значения — стандартный DateTimeField. Формат проверяется
+    заранее: fromisoformat принимает и строки, которые DateTimeField
+    отвергает (например, 2024-01-01T1000Z).
+    """
+
+    def to_python(self, value):
+        if isinstance(value, str) and DATETIME_LOCAL_RE.fullmatch(value):
+            try:
+                return from_current_timezone(datetime.fromisoformat(value))
+            except ValueError:
+                pass
+        return super().to_python(value)
+
 
 class PostForm(forms.ModelForm):
 
     class Meta:
         model = Post
         exclude = ('author', 'is_published', )
+        field_classes = {
+            'pub_date': DateTimeLocalField,
+        }
         widgets = {
             'pub_date': forms.DateTimeInput(
                 attrs={'type': 'datetime-local'},
-                format='%Y-%m-%dT%H:%M',)
+                format=DATETIME_LOCAL_FORMAT,)
         }
 
 
@@ -0,0 +1,34 @@
+# Generated by Django 3.2.16 on 2026-10-15 18:02
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('blog', '0006_post_indexes_id_tiebreaker'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='category',
+            name='category_published_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='post_pub_date_idx',
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='author',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='posts', to=settings.AUTH_USER_MODEL, verbose_name='Автор публикации'),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='category',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='posts', to='blog.category', verbose_name='Категория'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.utils import timezone
 
 from core.models import PublishedModel
 
@@ -40,6 +41,18 @@ class Category(PublishedModel):
         return self.title
 
 
+class PostQuerySet(models.QuerySet):
+
+    def published(self, now=None):
+        """Публикации, видимые всем: опубликованные в опубликованной
+        категории, с наступившей датой публикации."""
+        return self.filter(
+            is_published=True,
+            category__is_published=True,
+            pub_date__lte=now or timezone.now()
+        )
+
+
 class Post(PublishedModel):
     title = models.CharField(max_length=MAX_STR_LEN, verbose_name='Заголовок')
     text = models.TextField(verbose_name='Текст')
@@ -54,7 +67,8 @@ class Post(PublishedModel):
     author = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
-        verbose_name='Автор публикации'
+        verbose_name='Автор публикации',
+        db_index=False
     )
     location = models.ForeignKey(
         Location,
@@ -67,14 +81,39 @@ class Post(PublishedModel):
         Category,
         on_delete=models.SET_NULL,
         verbose_name='Категория',
-        null=True
+        null=True,
+        db_index=False
+    )
+    comments_count = models.PositiveIntegerField(
+        'Количество комментариев',
+        default=0,
+        editable=False
     )
 
+    objects = PostQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ('-pub_date',)
         default_related_name = 'posts'
+        # Индексы по автору и категории начинаются с внешнего ключа
+        # и заменяют собой обычные индексы этих полей.
+        indexes = (
+            models.Index(
+                fields=('-pub_date', '-id'),
+                condition=models.Q(is_published=True),
+                name='post_published_pub_date_idx'
+            ),
+            models.Index(
+                fields=('category', '-pub_date', '-id'),
+                name='post_category_pub_date_idx'
+            ),
+            models.Index(
+                fields=('author', '-pub_date', '-id'),
+                name='post_author_pub_date_idx'
+            ),
+        )
 
     def __str__(self):
         return self.title
@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+
+class PostPaginator(Paginator):
+    """Пагинатор списков публикаций.
+
+    Первая страница запрашивается с запасом в один объект: если запас
+    не понадобился, все объекты уже загружены и COUNT не нужен.
+
+    Если передан count_cache_key, число объектов берётся из кэша;
+    если по устаревшему числу страница оказалась пустой, оно
+    пересчитывается.
+    """
+
+    def __init__(self, object_list, per_page, count_cache_key=None,
+                 **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_cache_key = count_cache_key
+
+    @cached_property
+    def count(self):
+        if self.count_cache_key is None:
+            return super().count
+        count = cache.get(self.count_cache_key)
+        if count is None:
+            count = super().count
+            cache.set(
+                self.count_cache_key, count, settings.POSTS_CACHE_TIMEOUT
+            )
+        return count
+
+    def page(self, number):
+        if number == 1 and 'count' not in self.__dict__:
+            return self._first_page()
+        page = super().page(number)
+        if not page.object_list and self.count_cache_key is not None:
+            cache.delete(self.count_cache_key)
+            del self.count
+            self.__dict__.pop('num_pages', None)
+            page = super().page(number)
+        return page
+
+    def _first_page(self):
+        limit = self.per_page + self.orphans
+        head = list(self.object_list[:limit + 1])
+        if len(head) <= limit:
+            self.count = len(head)
+            return self._get_page(head, self.validate_number(1), self)
+        return self._get_page(head[:self.per_page], 1, self)
@@ -0,0 +1,53 @@
+from django.contrib.auth import get_user_model
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .caches import reset_content_caches
+from .models import Category, Comment, Location, Post
+
+User = get_user_model()
+
+
+def change_comments_count(post_id, delta):
+    Post.objects.filter(pk=post_id).update(
+        comments_count=Greatest(F('comments_count') + delta, 0)
+    )
+
+
+@receiver(pre_save, sender=Comment)
+def remember_comment_post(sender, instance, **kwargs):
+    """Запоминает, к какой публикации комментарий относился до сохранения."""
+    instance.previous_post_id = None
+    if instance.pk is not None:
+        instance.previous_post_id = Comment.objects.filter(
+            pk=instance.pk
+        ).values_list('post_id', flat=True).first()
+
+
+@receiver(post_save, sender=Comment)
+def update_comments_count(sender, instance, created, **kwargs):
+    previous_post_id = getattr(instance, 'previous_post_id', None)
+    if created:
+        change_comments_count(instance.post_id, 1)
+    elif previous_post_id not in (None, instance.post_id):
+        change_comments_count(previous_post_id, -1)
+        change_comments_count(instance.post_id, 1)
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comments_count(sender, instance, **kwargs):
+    change_comments_count(instance.post_id, -1)
+
+
+@receiver((post_save, post_delete), sender=Post)
+@receiver((post_save, post_delete), sender=Comment)
+@receiver((post_save, post_delete), sender=Category)
+@receiver((post_save, post_delete), sender=Location)
+@receiver((post_save, post_delete), sender=User)
+def reset_caches(sender, update_fields=None, **kwargs):
+    # Вход пользователя сохраняет только last_login, страницы не меняются.
+    if update_fields == {'last_login'}:
+        return
+    reset_content_caches()
@@ -1,17 +1,58 @@
+from hashlib import md5
+
 from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import etag
 from django.views.generic import (
     CreateView, DeleteView, DetailView, ListView, UpdateView
 )
 from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
-from django.db.models import Count, Q
+from django.db.models import Max
+from django.db.models.functions import Substr
 
 from .forms import CommentForm, PostForm
 from .models import Category, Comment, Post
+from .caches import PUBLISHED_POSTS_COUNT_KEY, get_content_version
+from .paginators import PostPaginator
+
+
+def get_now(request):
+    """Возвращает время запроса, одно на всю его обработку."""
+    if not hasattr(request, '_now'):
+        request._now = timezone.now()
+    return request._now
+
+
+def get_request_content_version(request):
+    """Возвращает версию содержимого блога, одну на всю обработку запроса."""
+    if not hasattr(request, '_content_version'):
+        request._content_version = get_content_version()
+    return request._content_version
+
+
+def get_content_etag(request, *args, **kwargs):
+    """ETag страниц блога.
+
+    Меняется при правке данных блога, для другого пользователя,
+    с новым CSRF-токеном (он есть в формах страницы) и с наступлением
+    даты отложенной публикации.
+    """
+    latest = Post.objects.published(get_now(request)).aggregate(
+        latest=Max('pub_date')
+    )['latest']
+    tag = '{}-{}-{}-{}'.format(
+        get_request_content_version(request),
+        request.user.pk,
+        request.META.get('CSRF_COOKIE', ''),
+        latest.timestamp() if latest else 0
+    )
+    return md5(tag.encode()).hexdigest()
 
 
 class PostFormMixin:
@@ -24,30 +65,83 @@ class CommentUpdateMixin:
     model = Comment
     template_name = 'blog/comment.html'
     form_class = CommentForm
+    pk_url_kwarg = 'comment_pk'
 
-    def get_object(self, queryset=None):
-        post_pk = self.kwargs.get('post_pk')
-        comment_pk = self.kwargs.get('comment_pk')
-        comment = get_object_or_404(Comment, pk=comment_pk, post__pk=post_pk)
-        if comment.author != self.request.user:
-            raise Http404("You don't have permission to edit this comment.")
-        return comment
+    def get_queryset(self):
+        return Comment.objects.filter(
+            post_id=self.kwargs['post_pk'],
+            author_id=self.request.user.pk
+        )
 
     def get_success_url(self):
-        post = self.object.post
-        return reverse('blog:post_detail', kwargs={'post_pk': post.pk})
+        return reverse(
+            'blog:post_detail',
+            kwargs={'post_pk': self.object.post_id}
+        )
 
 
 class PostUpdateDeleteMixin:
     pk_url_kwarg = 'post_pk'
+    post_object = None
+
+    def get_object(self, queryset=None):
+        if self.post_object is None:
+            self.post_object = super().get_object(queryset=queryset)
+        return self.post_object
 
     def dispatch(self, request, *args, **kwargs):
         post = self.get_object()
-        if post.author != request.user:
+        if post.author_id != request.user.pk:
             return redirect('blog:post_detail', post_pk=post.pk)
         return super().dispatch(request, *args, **kwargs)
 
 
+class PostAuthorEditMixin(
+    LoginRequiredMixin,
+    PostFormMixin,
+    PostUpdateDeleteMixin
+):
+    """Редактирование и удаление публикации её автором."""
+
+
+class AnonymousCacheMixin:
+    """Кэширует страницу для неавторизованных пользователей.
+
+    Версия содержимого входит в ключ кэша, поэтому после правки
+    данных блога страница строится заново. Кэш только серверный:
+    браузер каждый раз переспрашивает страницу по ETag.
+    """
+    cache_timeout = settings.POSTS_CACHE_TIMEOUT
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().dispatch(request, *args, **kwargs)
+        response = cache_page(
+            self.cache_timeout,
+            key_prefix=get_request_content_version(request)
+        )(super().dispatch)(request, *args, **kwargs)
+        if getattr(response, 'is_rendered', True):
+            return self.revalidate(response)
+        # cache_page ставит заголовки после отрисовки шаблона.
+        response.add_post_render_callback(self.revalidate)
+        return response
+
+    @staticmethod
+    def revalidate(response):
+        del response['Expires']
+        patch_cache_control(response, max_age=0, no_cache=True)
+        return response
+
+
+class ContentETagMixin:
+    """Отвечает 304, если содержимое страницы не менялось."""
+
+    def dispatch(self, request, *args, **kwargs):
+        return etag(get_content_etag)(super().dispatch)(
+            request, *args, **kwargs
+        )
+
+
 class QuerySetOptimizationMixin:
     def get_queryset(self):
         return Post.objects.select_related(
@@ -55,20 +149,56 @@ class QuerySetOptimizationMixin:
         ).all()
 
 
-class PostListView(QuerySetOptimizationMixin, ListView):
+class PostListMixin:
+    """Готовит список публикаций для карточек.
+
+    Загружает только поля, нужные карточке; вместо полного текста
+    публикации — его начало для анонса.
+    """
+    paginator_class = PostPaginator
+    count_cache_key = None
+    preview_length = 300
+    card_fields = (
+        'title',
+        'pub_date',
+        'image',
+        'is_published',
+        'comments_count',
+        'author__username',
+        'category__title',
+        'category__slug',
+        'category__is_published',
+        'location__name',
+        'location__is_published',
+    )
+
+    def get_post_list(self, queryset):
+        return queryset.only(*self.card_fields).annotate(
+            text_preview=Substr('text', 1, self.preview_length)
+        ).order_by('-pub_date', '-pk')
+
+    def get_paginator(self, queryset, per_page, orphans=0,
+                      allow_empty_first_page=True, **kwargs):
+        return super().get_paginator(
+            queryset,
+            per_page,
+            orphans=orphans,
+            allow_empty_first_page=allow_empty_first_page,
+            count_cache_key=self.count_cache_key,
+            **kwargs
+        )
+
+
+class PostListView(ContentETagMixin, AnonymousCacheMixin,
+                   QuerySetOptimizationMixin, PostListMixin, ListView):
     model = Post
     template_name = 'blog/index.html'
     paginate_by = settings.POSTS_PER_PAGE
+    count_cache_key = PUBLISHED_POSTS_COUNT_KEY
 
     def get_queryset(self):
-        queryset = super().get_queryset()
-        queryset = queryset.filter(
-            Q(is_published=True)
-            & Q(category__is_published=True)
-            & Q(pub_date__lte=timezone.now())
-        ).annotate(comments_count=Count('comments')
-                   ).order_by('-pub_date')
-        return queryset
+        queryset = super().get_queryset().published(get_now(self.request))
+        return self.get_post_list(queryset)
 
 
 class PostCreateView(LoginRequiredMixin, PostFormMixin, CreateView):
@@ -84,27 +214,20 @@ class PostCreateView(LoginRequiredMixin, PostFormMixin, CreateView):
         )
 
 
-class PostUpdateView(
-    LoginRequiredMixin,
-    PostFormMixin,
-    PostUpdateDeleteMixin,
-    UpdateView
-):
+class PostUpdateView(PostAuthorEditMixin, UpdateView):
     def get_success_url(self):
-        post = self.object
-        return reverse('blog:post_detail', kwargs={'post_pk': post.pk})
+        return reverse(
+            'blog:post_detail',
+            kwargs={'post_pk': self.object.pk}
+        )
 
 
-class PostDeleteView(
-    LoginRequiredMixin,
-    PostFormMixin,
-    PostUpdateDeleteMixin,
-    DeleteView
-):
+class PostDeleteView(PostAuthorEditMixin, DeleteView):
     success_url = reverse_lazy('blog:index')
 
 
-class PostDetailView(DetailView):
+class PostDetailView(ContentETagMixin, QuerySetOptimizationMixin,
+                     DetailView):
     model = Post
     template_name = 'blog/detail.html'
     pk_url_kwarg = 'post_pk'
@@ -114,14 +237,14 @@ class PostDetailView(DetailView):
         if ((self.request.user != post.author)
             and ((not post.category.is_published)
                  or (not post.is_published)
-                 or (post.pub_date > timezone.now()))):
+                 or (post.pub_date > get_now(self.request)))):
             raise Http404('Пост снят с публикации и доступен только автору')
         return post
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = self.object.comments.all()
+        context['comments'] = self.object.comments.select_related('author')
         return context
 
 
@@ -131,8 +254,9 @@ class CommentCreateView(LoginRequiredMixin, CreateView):
     form_class = CommentForm
 
     def form_valid(self, form):
-        post = get_object_or_404(Post, pk=self.kwargs['post_pk'])
-        form.instance.post = post
+        if not Post.objects.filter(pk=self.kwargs['post_pk']).exists():
+            raise Http404
+        form.instance.post_id = self.kwargs['post_pk']
         form.instance.author = self.request.user
         return super().form_valid(form)
 
@@ -151,29 +275,36 @@ class CommentDeleteView(LoginRequiredMixin, CommentUpdateMixin, DeleteView):
     pass
 
 
-class ProfileListView(QuerySetOptimizationMixin, ListView):
+class ProfileListView(PostListMixin, ListView):
     model = Post
     template_name = 'blog/profile.html'
     paginate_by = settings.POSTS_PER_PAGE
     profile = None
+    # Автор всех публикаций — владелец профиля, он уже загружен.
+    card_fields = tuple(
+        field for field in PostListMixin.card_fields
+        if not field.startswith('author__')
+    )
 
     def get_queryset(self):
-        query_set = super().get_queryset()
         self.profile = get_object_or_404(
             User,
             username=self.kwargs['username']
         )
-        query_set = query_set.filter(
-            author=self.profile
-        ).annotate(comments_count=Count('comments')
-                   ).order_by('-pub_date')
+        query_set = Post.objects.select_related(
+            'location', 'category'
+        ).filter(author=self.profile)
         if self.request.user != self.profile:
-            query_set = query_set.filter(
-                Q(is_published=True)
-                & Q(pub_date__lte=timezone.now())
-                & Q(category__is_published=True)
-            )
-        return query_set
+            query_set = query_set.published(get_now(self.request))
+        return self.get_post_list(query_set)
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator, page, _, is_paginated = super().paginate_queryset(
+            queryset, page_size
+        )
+        for post in page:
+            post.author = self.profile
+        return paginator, page, page.object_list, is_paginated
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -190,31 +321,29 @@ class ProfileUpdateView(LoginRequiredMixin, UpdateView):
         return self.request.user
 
     def get_success_url(self):
-        return reverse_lazy(
+        return reverse(
             'blog:profile',
             kwargs={'username': self.request.user.username}
         )
 
 
-class CategoryPostListView(QuerySetOptimizationMixin, ListView):
+class CategoryPostListView(AnonymousCacheMixin, QuerySetOptimizationMixin,
+                           PostListMixin, ListView):
     template_name = 'blog/category.html'
     context_object_name = 'post_list'
     paginate_by = settings.POSTS_PER_PAGE
     category = None
 
     def get_queryset(self):
-        category_slug = self.kwargs['category_slug']
         self.category = get_object_or_404(
             Category,
             slug=self.kwargs['category_slug'],
             is_published=True
         )
-        return super().get_queryset().filter(
-            Q(category__slug=category_slug)
-            & Q(is_published=True)
-            & Q(category__is_published=True)
-            & Q(pub_date__lte=timezone.now())
-        )
+        queryset = super().get_queryset().filter(
+            category=self.category
+        ).published(get_now(self.request))
+        return self.get_post_list(queryset)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -93,6 +94,22 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+
+# В кэше хранится версия содержимого блога, поэтому при нескольких
+# процессах сайта он должен быть общим (Memcached, Redis), см. README.
+# Без настройки используется память процесса.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -161,3 +178,5 @@ INTERNAL_IPS = [
 LOGIN_REDIRECT_URL = 'blog:index'
 
 POSTS_PER_PAGE = 10
+
+POSTS_CACHE_TIMEOUT = 60
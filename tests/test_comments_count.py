@@ -0,0 +1,74 @@
+import pytest
+from django.db.models import Model
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def get_comments_count(post: Model) -> int:
+    post.refresh_from_db(fields=("comments_count",))
+    return post.comments_count
+
+
+def test_comments_count_on_create_and_delete(
+    mixer: Mixer, post_with_published_location: Model
+):
+    post = post_with_published_location
+    comments = mixer.cycle(3).blend("blog.Comment", post=post)
+    assert get_comments_count(post) == 3, (
+        "Убедитесь, что при создании комментария счётчик комментариев"
+        " публикации увеличивается."
+    )
+    comments[0].delete()
+    assert get_comments_count(post) == 2, (
+        "Убедитесь, что при удалении комментария счётчик комментариев"
+        " публикации уменьшается."
+    )
+
+
+def test_comments_count_on_edit(
+    mixer: Mixer, post_with_published_location: Model
+):
+    post = post_with_published_location
+    comment = mixer.blend("blog.Comment", post=post)
+    comment.text = "edited"
+    comment.save()
+    assert get_comments_count(post) == 1, (
+        "Убедитесь, что при редактировании комментария счётчик"
+        " комментариев публикации не меняется."
+    )
+
+
+def test_comments_count_on_move(
+    mixer: Mixer,
+    post_with_published_location: Model,
+    post_of_another_author: Model,
+):
+    old_post = post_with_published_location
+    new_post = post_of_another_author
+    comment = mixer.blend("blog.Comment", post=old_post)
+    comment.post = new_post
+    comment.save()
+    assert get_comments_count(old_post) == 0, (
+        "Убедитесь, что при переносе комментария счётчик прежней"
+        " публикации уменьшается."
+    )
+    assert get_comments_count(new_post) == 1, (
+        "Убедитесь, что при переносе комментария счётчик новой"
+        " публикации увеличивается."
+    )
+    comment.delete()
+    assert get_comments_count(new_post) == 0
+    assert get_comments_count(old_post) == 0
+
+
+def test_comments_count_never_negative(
+    mixer: Mixer, post_with_published_location: Model
+):
+    post = post_with_published_location
+    comment = mixer.blend("blog.Comment", post=post)
+    type(post).objects.filter(pk=post.pk).update(comments_count=0)
+    comment.delete()
+    assert get_comments_count(post) == 0, (
+        "Убедитесь, что счётчик комментариев не становится отрицательным."
+    )
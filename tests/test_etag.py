@@ -0,0 +1,68 @@
+import re
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db.models import Model
+from django.test.client import Client
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+PASSWORD = "etag-test-password"
+CSRF_INPUT_RE = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+
+@pytest.fixture
+def csrf_client(mixer: Mixer):
+    user = mixer.blend(get_user_model())
+    user.set_password(PASSWORD)
+    user.save()
+    client = Client(enforce_csrf_checks=True)
+    client.username = user.username
+    return client
+
+
+def log_in(client: Client):
+    client.get("/auth/login/")
+    response = client.post(
+        "/auth/login/",
+        {
+            "username": client.username,
+            "password": PASSWORD,
+            "csrfmiddlewaretoken": client.cookies["csrftoken"].value,
+        },
+    )
+    assert response.status_code == HTTPStatus.FOUND
+
+
+def test_etag_changes_after_relogin(
+    csrf_client: Client, post_with_published_location: Model
+):
+    url = f"/posts/{post_with_published_location.id}/"
+    comment_url = f"/posts/{post_with_published_location.id}/comment"
+    log_in(csrf_client)
+    response = csrf_client.get(url)
+    etag = response["ETag"]
+    cached_token = CSRF_INPUT_RE.search(response.content.decode()).group(1)
+    assert csrf_client.get(
+        url, HTTP_IF_NONE_MATCH=etag
+    ).status_code == HTTPStatus.NOT_MODIFIED, (
+        "Убедитесь, что неизменившаяся страница публикации отдаётся"
+        " с кодом 304."
+    )
+
+    csrf_client.get("/auth/logout/")
+    log_in(csrf_client)
+    response = csrf_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что после повторного входа страница публикации"
+        " строится заново: CSRF-токен в её форме сменился."
+    )
+    token = CSRF_INPUT_RE.search(response.content.decode()).group(1)
+    assert csrf_client.post(
+        comment_url, {"text": "text", "csrfmiddlewaretoken": cached_token}
+    ).status_code == HTTPStatus.FORBIDDEN
+    assert csrf_client.post(
+        comment_url, {"text": "text", "csrfmiddlewaretoken": token}
+    ).status_code == HTTPStatus.FOUND
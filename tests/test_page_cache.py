@@ -0,0 +1,70 @@
+import pytest
+from django.core.cache import cache
+from django.db.models import Model
+from django.test.client import Client
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def rename_silently(post: Model, title: str):
+    # update() не отправляет сигналы и не сбрасывает кэш.
+    type(post).objects.filter(pk=post.pk).update(title=title)
+
+
+def test_anonymous_page_cached_on_server_only(
+    client: Client, post_with_published_location: Model
+):
+    response = client.get("/")
+    rename_silently(post_with_published_location, "Переименованная")
+    assert "Переименованная" not in client.get("/").content.decode(), (
+        "Убедитесь, что главная страница кэшируется для анонимных"
+        " пользователей."
+    )
+    assert "max-age=0" in response["Cache-Control"], (
+        "Убедитесь, что кэш страницы только серверный: браузер должен"
+        " проверять её по ETag при каждом запросе."
+    )
+    assert not response.has_header("Expires")
+
+
+def test_authenticated_user_skips_page_cache(
+    client: Client, user_client: Client, post_with_published_location: Model
+):
+    client.get("/")
+    rename_silently(post_with_published_location, "Переименованная")
+    assert "Переименованная" in user_client.get("/").content.decode(), (
+        "Убедитесь, что авторизованным пользователям страница не отдаётся"
+        " из кэша."
+    )
+
+
+def test_post_save_invalidates_page_cache(
+    client: Client, post_with_published_location: Model
+):
+    client.get("/")
+    post_with_published_location.title = "Переименованная"
+    post_with_published_location.save()
+    assert "Переименованная" in client.get("/").content.decode(), (
+        "Убедитесь, что после изменения публикации кэш страницы"
+        " сбрасывается."
+    )
+
+
+def test_login_does_not_invalidate_page_cache(
+    client: Client, user: Model, post_with_published_location: Model
+):
+    client.get("/")
+    rename_silently(post_with_published_location, "Переименованная")
+    user.last_login = timezone.now()
+    user.save(update_fields=["last_login"])
+    assert "Переименованная" not in client.get("/").content.decode(), (
+        "Убедитесь, что вход пользователя не сбрасывает кэш страниц."
+    )
@@ -0,0 +1,109 @@
+import pytest
+from django.core.cache import cache
+from django.core.paginator import EmptyPage
+from django.db.models import Model
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+from blog.models import Post
+from blog.paginators import PostPaginator
+
+pytestmark = [pytest.mark.django_db]
+
+PER_PAGE = 3
+COUNT_CACHE_KEY = "test_posts_count"
+
+
+@pytest.fixture
+def posts_queryset(mixer: Mixer, user: Model):
+    # Одинаковая дата у всех публикаций: порядок задаёт только pk.
+    mixer.cycle(8).blend("blog.Post", author=user, pub_date=timezone.now())
+    return Post.objects.order_by("-pub_date", "-pk")
+
+
+@pytest.fixture
+def count_cache():
+    cache.delete(COUNT_CACHE_KEY)
+    yield COUNT_CACHE_KEY
+    cache.delete(COUNT_CACHE_KEY)
+
+
+def page_pks(page):
+    return [post.pk for post in page]
+
+
+def test_first_page_without_overflow(
+    posts_queryset, django_assert_num_queries
+):
+    paginator = PostPaginator(posts_queryset, 10)
+    with django_assert_num_queries(1):
+        page = paginator.page(1)
+        assert paginator.count == 8, (
+            "Убедитесь, что если все объекты поместились на первую"
+            " страницу, их число известно без отдельного запроса COUNT."
+        )
+    assert page_pks(page) == list(posts_queryset.values_list("pk", flat=True))
+    assert not page.has_next()
+
+
+def test_first_page_with_overflow(posts_queryset, django_assert_num_queries):
+    paginator = PostPaginator(posts_queryset, PER_PAGE)
+    with django_assert_num_queries(1):
+        page = paginator.page(1)
+    assert page_pks(page) == list(
+        posts_queryset.values_list("pk", flat=True)[:PER_PAGE]
+    ), "Убедитесь, что первая страница не содержит лишний объект."
+    with django_assert_num_queries(1):
+        assert paginator.count == 8
+    assert page.has_next()
+    assert paginator.num_pages == 3
+
+
+def test_pages_order_and_last_page(posts_queryset):
+    expected = list(posts_queryset.values_list("pk", flat=True))
+    paginator = PostPaginator(posts_queryset, PER_PAGE)
+    pks = []
+    for number in paginator.page_range:
+        pks += page_pks(paginator.page(number))
+    assert pks == expected, (
+        "Убедитесь, что публикации с одинаковой датой идут на страницах"
+        " в одном и том же порядке."
+    )
+    last_page = paginator.page(paginator.num_pages)
+    assert len(last_page) == 2, (
+        "Убедитесь, что последняя неполная страница содержит"
+        " оставшиеся публикации."
+    )
+    assert last_page.start_index() == 7
+    assert last_page.end_index() == 8
+
+
+def test_last_page_takes_orphans(posts_queryset):
+    paginator = PostPaginator(posts_queryset, PER_PAGE, orphans=2)
+    assert paginator.num_pages == 2
+    assert page_pks(paginator.page(2)) == list(
+        posts_queryset.values_list("pk", flat=True)[PER_PAGE:]
+    )
+
+
+def test_cached_count_is_used(
+    posts_queryset, count_cache, django_assert_num_queries
+):
+    cache.set(count_cache, 8)
+    paginator = PostPaginator(posts_queryset, PER_PAGE, count_cache)
+    page = paginator.page(2)
+    with django_assert_num_queries(0):
+        assert paginator.count == 8
+    assert len(page) == PER_PAGE
+
+
+def test_stale_cached_count_too_high(posts_queryset, count_cache):
+    cache.set(count_cache, 20)
+    paginator = PostPaginator(posts_queryset, PER_PAGE, count_cache)
+    with pytest.raises(EmptyPage):
+        paginator.page(5)
+    assert paginator.count == 8, (
+        "Убедитесь, что устаревшее число публикаций в кэше пересчитывается,"
+        " если страница по нему оказалась пустой."
+    )
+    assert cache.get(count_cache) == 8
@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+
+import pytest
+from django import forms
+from django.core.exceptions import ValidationError
+from django.test import override_settings
+
+from blog.forms import DateTimeLocalField
+
+
+@override_settings(TIME_ZONE="Europe/Moscow")
+def test_datetime_local_value_is_aware_in_time_zone():
+    value = DateTimeLocalField().to_python("2024-01-01T10:00")
+    assert value == datetime(2024, 1, 1, 7, 0, tzinfo=timezone.utc), (
+        "Убедитесь, что дата из поля datetime-local считается временем"
+        " в часовом поясе TIME_ZONE."
+    )
+    assert value == forms.DateTimeField().to_python("2024-01-01T10:00")
+
+
+@pytest.mark.parametrize(
+    "value", ["2024-01-01T1000Z", "2024-13-01T10:00", "2024-W01-1T10:00"]
+)
+def test_invalid_datetime_local_value(value):
+    with pytest.raises(ValidationError):
+        DateTimeLocalField().to_python(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-01-01 10:00",
+        "2024-01-01T10:00:30",
+        "2024-01-01 10:00:30.5",
+        datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc),
+        "",
+        None,
+    ],
+)
+def test_other_values_fall_back_to_datetime_field(value):
+    assert DateTimeLocalField().to_python(value) == (
+        forms.DateTimeField().to_python(value)
+    ), (
+        "Убедитесь, что значения другого вида разбираются"
+        " так же, как в DateTimeField."
+    )